@@ -12,10 +12,15 @@ Usage:
 """
 
 import argparse
-import json
+import gzip
 import os
+import random
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import groupby
 from pathlib import Path
 
 try:
@@ -25,6 +30,9 @@ except ImportError:
     os.system(f"{sys.executable} -m pip install requests -q")
     import requests
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 try:
     import markdown
 except ImportError:
@@ -32,6 +40,22 @@ except ImportError:
     os.system(f"{sys.executable} -m pip install markdown -q")
     import markdown
 
+try:
+    from pyrate_limiter import Duration, Limiter, Rate
+except ImportError:
+    print("Installing pyrate-limiter...")
+    # Pinned below 4.0: the Limiter(Rate(...), raise_when_fail=, max_delay=)
+    # signature used here was dropped in the 4.x rewrite.
+    os.system(f"{sys.executable} -m pip install 'pyrate-limiter<4' -q")
+    from pyrate_limiter import Duration, Limiter, Rate
+
+try:
+    import orjson
+except ImportError:
+    print("Installing orjson...")
+    os.system(f"{sys.executable} -m pip install orjson -q")
+    import orjson
+
 
 # ---------------------------------------------------------------------------
 # Auth
@@ -53,35 +77,260 @@ def get_auth():
 # Confluence API helpers
 # ---------------------------------------------------------------------------
 
+class AIMDController:
+    """Additive-increase / multiplicative-decrease admission control.
+
+    Tracks request latency over a sliding window. While the average stays at
+    or below `target_latency` and requests succeed, allowed concurrency grows
+    by `alpha`; on an error (429/5xx) or when latency exceeds the target, it
+    is multiplied by `beta`. Workers call acquire()/release() around each
+    request so in-flight requests never exceed the current limit.
+    """
+
+    def __init__(self, initial=5, minimum=1, maximum=20, alpha=0.5, beta=0.5, target_latency=1.0):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.alpha = alpha
+        self.beta = beta
+        self.target_latency = target_latency
+        self._limit = float(initial)
+        self._latencies = deque(maxlen=20)
+        self._lock = threading.Lock()
+        self._sem = threading.Semaphore(initial)
+        self._debt = 0  # permits to swallow on release() after a shrink
+
+    def acquire(self):
+        self._sem.acquire()
+
+    def release(self):
+        with self._lock:
+            if self._debt > 0:
+                self._debt -= 1
+                return
+        self._sem.release()
+
+    def record(self, latency, ok):
+        with self._lock:
+            self._latencies.append(latency)
+            avg = sum(self._latencies) / len(self._latencies)
+            old = int(self._limit)
+            if not ok or avg > self.target_latency:
+                self._limit = max(self.minimum, self._limit * self.beta)
+            else:
+                self._limit = min(self.maximum, self._limit + self.alpha)
+            new = int(self._limit)
+            if new == old:
+                return
+            print(f"  ⚙️  Concurrency {old} → {new} (avg latency {avg:.2f}s)")
+            if new > old:
+                grow = new - old
+            else:
+                self._debt += old - new
+                return
+        for _ in range(grow):
+            self._sem.release()
+
+
 class ConfluenceClient:
-    def __init__(self, instance, space_key, auth, dry_run=False):
+    def __init__(
+        self,
+        instance,
+        space_key,
+        auth,
+        dry_run=False,
+        max_rate=10,
+        parallel=5,
+        upload_concurrency=10,
+    ):
         self.base_url = f"https://{instance}/wiki/rest/api"
         self.space_key = space_key
         self.auth = auth
         self.dry_run = dry_run
+        # One Session = keep-alive connection pool; avoids a fresh TCP+TLS
+        # handshake per API call against the Atlassian endpoint.
+        self.session = requests.Session()
+        self.session.auth = auth
+        self.session.headers["Content-Type"] = "application/json"
+        self.session.headers["Accept-Encoding"] = "gzip"
+        # Token bucket shared by all workers: at most `max_rate` API calls
+        # per second globally, blocking (rather than failing) when exhausted.
+        self.limiter = Limiter(
+            Rate(max_rate, Duration.SECOND), raise_when_fail=False, max_delay=Duration.MINUTE
+        )
+        # Self-tuning admission control: starts at `parallel` in-flight
+        # requests and adapts to observed latency/errors.
+        self.controller = AIMDController(initial=parallel, maximum=max(parallel * 2, 10))
+        # Caps how many file payloads (raw text + XHTML + JSON body) may be
+        # in flight at once, so peak memory stays flat on large trees.
+        self.upload_sem = threading.BoundedSemaphore(upload_concurrency)
+        # Transport-level retries only smooth over connection setup/read
+        # blips; status-based retries live in _do_request so Retry-After and
+        # jittered backoff are honored.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[],
+            allowed_methods=["GET", "POST", "DELETE"],
+        )
+        # Keep-alive pool sized to the concurrency ceiling so a full batch of
+        # sibling POSTs rides warm connections instead of queuing on pool slots.
+        pool = max(16, self.controller.maximum)
+        self.session.mount(
+            "https://", HTTPAdapter(pool_connections=pool, pool_maxsize=pool, max_retries=retry)
+        )
         self.stats = {"created": 0, "skipped": 0, "failed": 0, "deleted": 0}
+        self._stats_lock = threading.Lock()
+        # Memoized title -> page ID lookups (None = known miss). Valid for
+        # the life of the run; create/delete keep it in sync.
+        self._title_cache = {}
+        self._cache_lock = threading.Lock()
+
+    def _bump(self, key):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _throttle(self):
+        self.limiter.try_acquire("confluence")
+
+    MAX_ATTEMPTS = 5
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def _do_request(self, method, url, **kwargs):
+        """Rate-limited request with backoff on transient failures.
+
+        Transient statuses (429/5xx) and connection-level errors are retried
+        up to MAX_ATTEMPTS times, sleeping the server-provided Retry-After
+        when present and otherwise 2**attempt seconds plus jitter (capped at
+        60s). When X-RateLimit-Remaining falls below 10% of the limit,
+        sleeps briefly to back off before the quota is actually exhausted.
+        """
+        resp = None
+        for attempt in range(self.MAX_ATTEMPTS):
+            backoff = min(60, 2**attempt + random.uniform(0, 1))
+            self._throttle()
+            self.controller.acquire()
+            start = time.monotonic()
+            try:
+                resp = self.session.request(method, url, **kwargs)
+            except requests.RequestException as exc:
+                self.controller.record(time.monotonic() - start, False)
+                if attempt == self.MAX_ATTEMPTS - 1:
+                    raise
+                print(f"  ⏳ {type(exc).__name__} — retrying in {backoff:.1f}s")
+                time.sleep(backoff)
+                continue
+            finally:
+                self.controller.release()
+            self.controller.record(
+                time.monotonic() - start, resp.status_code not in self.RETRY_STATUSES
+            )
+            if resp.status_code in self.RETRY_STATUSES:
+                # Retry-After may also be an HTTP-date (proxies emit it);
+                # fall back to our own backoff if it isn't plain seconds.
+                try:
+                    wait = float(resp.headers["Retry-After"])
+                except (KeyError, ValueError):
+                    wait = backoff
+                print(f"  ⏳ HTTP {resp.status_code} — waiting {wait:.1f}s before retry")
+                time.sleep(wait)
+                continue
+            self._check_quota(resp)
+            return resp
+        return resp
+
+    def _post_json(self, url, payload):
+        """POST a JSON payload, gzip-compressing bodies over 1 KB.
+
+        Code-heavy pages serialize to tens or hundreds of KB of XHTML;
+        gzip cuts that 5-10x. Small payloads skip compression since the
+        header overhead outweighs the savings.
+        """
+        raw = orjson.dumps(payload)
+        if len(raw) > 1024:
+            return self._do_request(
+                "POST", url, data=gzip.compress(raw), headers={"Content-Encoding": "gzip"}
+            )
+        return self._do_request("POST", url, data=raw)
+
+    def _check_quota(self, resp):
+        try:
+            remaining = int(resp.headers["X-RateLimit-Remaining"])
+            limit = int(resp.headers["X-RateLimit-Limit"])
+        except (KeyError, ValueError):
+            return
+        if limit > 0 and remaining / limit < 0.1:
+            time.sleep(1.0)
 
     def find_page(self, title):
-        """Find a page by exact title in the space. Returns page ID or None."""
+        """Find a page by exact title in the space. Returns page ID or None.
+
+        Lookups (including misses) are cached, so repeat queries for the
+        same title cost no network call within a run.
+        """
+        with self._cache_lock:
+            if title in self._title_cache:
+                return self._title_cache[title]
         params = {"title": title, "spaceKey": self.space_key, "type": "page"}
-        resp = requests.get(f"{self.base_url}/content", params=params, auth=self.auth)
+        resp = self._do_request("GET", f"{self.base_url}/content", params=params)
+        page_id = None
         if resp.status_code == 200:
-            for r in resp.json().get("results", []):
+            for r in orjson.loads(resp.content).get("results", []):
                 if r["title"] == title:
-                    return r["id"]
-        return None
+                    page_id = r["id"]
+                    break
+        with self._cache_lock:
+            self._title_cache[title] = page_id
+        return page_id
+
+    def prefetch_titles(self, root_parent_id):
+        """Bulk-load the title cache for every page under root_parent_id.
+
+        One paginated CQL search replaces the per-page find_page GETs, so
+        existence checks for an already-uploaded tree resolve from memory.
+        """
+        cql = f'space="{self.space_key}" and type=page and ancestor="{root_parent_id}"'
+        start = 0
+        fetched = 0
+        while True:
+            resp = self._do_request(
+                "GET",
+                f"{self.base_url}/content/search",
+                params={"cql": cql, "limit": 250, "start": start},
+            )
+            if resp.status_code != 200:
+                print(f"  ⚠️  Prefetch failed (HTTP {resp.status_code}); falling back to optimistic creates")
+                return
+            data = orjson.loads(resp.content)
+            results = data.get("results", [])
+            with self._cache_lock:
+                for r in results:
+                    self._title_cache[r["title"]] = r["id"]
+            fetched += len(results)
+            if len(results) < data.get("limit", 250):
+                break
+            start += len(results)
+        if fetched:
+            print(f"  📇 Prefetched {fetched} existing page titles")
 
     def create_page(self, title, body_html, parent_id):
-        """Create a page under parent_id. Skips if title already exists."""
-        existing = self.find_page(title)
+        """Create a page under parent_id. Skips if title already exists.
+
+        Existence is checked against the in-process cache only (seeded by
+        prefetch_titles); otherwise the POST is sent optimistically and
+        Confluence's "title already exists" rejection is treated as the skip
+        case. That makes the common new-page path one API call instead of a
+        find_page GET followed by the POST.
+        """
+        with self._cache_lock:
+            existing = self._title_cache.get(title)
         if existing:
             print(f"  ⏭  Exists: '{title}' (id={existing})")
-            self.stats["skipped"] += 1
+            self._bump("skipped")
             return existing
 
         if self.dry_run:
             print(f"  🔍 [dry-run] Would create: '{title}' under {parent_id}")
-            self.stats["created"] += 1
+            self._bump("created")
             return "dry-run-id"
 
         payload = {
@@ -96,45 +345,100 @@ class ConfluenceClient:
                 }
             },
         }
-        resp = requests.post(
-            f"{self.base_url}/content",
-            json=payload,
-            auth=self.auth,
-            headers={"Content-Type": "application/json"},
-        )
+        resp = self._post_json(f"{self.base_url}/content", payload)
         if resp.status_code in (200, 201):
-            page = resp.json()
+            page = orjson.loads(resp.content)
             print(f"  ✅ Created: '{page['title']}' (id={page['id']})")
-            self.stats["created"] += 1
+            with self._cache_lock:
+                self._title_cache[title] = page["id"]
+            self._bump("created")
             return page["id"]
-        else:
-            print(f"  ❌ Failed: '{title}' — HTTP {resp.status_code}")
-            try:
-                print(f"     {resp.json().get('message', resp.text[:200])}")
-            except Exception:
-                print(f"     {resp.text[:200]}")
-            self.stats["failed"] += 1
-            return None
+
+        try:
+            message = orjson.loads(resp.content).get("message", resp.text[:200])
+        except Exception:
+            message = resp.text[:200]
+
+        # Title collision: resolve the existing page's ID with one GET.
+        if resp.status_code == 400 and "already exists" in message:
+            existing = self.find_page(title)
+            if existing:
+                print(f"  ⏭  Exists: '{title}' (id={existing})")
+                self._bump("skipped")
+                return existing
+
+        print(f"  ❌ Failed: '{title}' — HTTP {resp.status_code}")
+        print(f"     {message}")
+        self._bump("failed")
+        return None
+
+    def list_descendants(self, page_id):
+        """Return `(depth, id, title)` for every page under page_id.
+
+        One paginated CQL query with ancestors expanded; depth is the length
+        of the ancestor chain, so callers can order deletes leaf-first.
+        """
+        descendants = []
+        cql = f'ancestor="{page_id}"'
+        start = 0
+        while True:
+            resp = self._do_request(
+                "GET",
+                f"{self.base_url}/content/search",
+                params={"cql": cql, "expand": "ancestors", "limit": 200, "start": start},
+            )
+            if resp.status_code != 200:
+                print(f"  ⚠️  Descendant listing failed (HTTP {resp.status_code})")
+                return None
+            data = orjson.loads(resp.content)
+            results = data.get("results", [])
+            for r in results:
+                descendants.append((len(r.get("ancestors", [])), r["id"], r["title"]))
+            if len(results) < data.get("limit", 200):
+                return descendants
+            start += len(results)
+
+    def _delete_by_id(self, page_id, title):
+        resp = self._do_request("DELETE", f"{self.base_url}/content/{page_id}")
+        if resp.status_code in (200, 204):
+            print(f"  🗑  Deleted: '{title}' (id={page_id})")
+            with self._cache_lock:
+                self._title_cache.pop(title, None)
+            self._bump("deleted")
+            return True
+        print(f"  ❌ Failed to delete '{title}': HTTP {resp.status_code}")
+        return False
 
     def delete_page(self, title):
-        """Delete a page by title (cascades to children)."""
+        """Delete a page tree by title.
+
+        Rather than relying on Confluence's synchronous server-side cascade
+        (minutes for large subtrees), all descendant IDs are fetched in one
+        CQL query and deleted in parallel, deepest level first so no delete
+        cascades into a page another worker is removing. Falls back to the
+        single cascading delete if the listing fails.
+        """
         page_id = self.find_page(title)
         if not page_id:
             print(f"  ⚠️  Page not found: '{title}'")
             return False
 
+        descendants = self.list_descendants(page_id) or []
+
         if self.dry_run:
-            print(f"  🔍 [dry-run] Would delete: '{title}' (id={page_id})")
+            print(f"  🔍 [dry-run] Would delete: '{title}' (id={page_id}) and {len(descendants)} descendants")
             return True
 
-        resp = requests.delete(f"{self.base_url}/content/{page_id}", auth=self.auth)
-        if resp.status_code in (200, 204):
-            print(f"  🗑  Deleted: '{title}' (id={page_id}) and all children")
-            self.stats["deleted"] += 1
-            return True
-        else:
-            print(f"  ❌ Failed to delete '{title}': HTTP {resp.status_code}")
-            return False
+        descendants.sort(key=lambda d: d[0], reverse=True)
+        with ThreadPoolExecutor(max_workers=self.controller.maximum) as executor:
+            for _, level in groupby(descendants, key=lambda d: d[0]):
+                futures = [
+                    executor.submit(self._delete_by_id, pid, page_title)
+                    for _, pid, page_title in level
+                ]
+                for fut in as_completed(futures):
+                    fut.result()
+        return self._delete_by_id(page_id, title)
 
     def print_stats(self):
         print(f"\n{'='*60}")
@@ -151,58 +455,123 @@ class ConfluenceClient:
 # Markdown conversion
 # ---------------------------------------------------------------------------
 
+# Built once per process: markdown.markdown() re-instantiates the Markdown
+# class and re-loads every extension on each call, which dominates the cost
+# of converting small files. Process-pool workers get their own copy at
+# module import.
+_MD = markdown.Markdown(
+    extensions=["tables", "fenced_code", "codehilite", "toc", "nl2br"],
+)
+
+
+_EMPTY_BODY = "<p><em>Empty document</em></p>"
+
+
 def md_to_storage(md_content):
     """Convert markdown text to Confluence storage format (XHTML)."""
-    html = markdown.markdown(
-        md_content,
-        extensions=["tables", "fenced_code", "codehilite", "toc", "nl2br"],
-    )
-    return html if html.strip() else "<p><em>Empty document</em></p>"
+    if not md_content.strip():
+        return _EMPTY_BODY
+    _MD.reset()
+    html = _MD.convert(md_content)
+    return html if html.strip() else _EMPTY_BODY
+
+
+def convert_file(filepath):
+    """Read and convert one markdown file (process-pool worker, picklable)."""
+    return md_to_storage(Path(filepath).read_text(encoding="utf-8"))
 
 
 # ---------------------------------------------------------------------------
 # Directory walker
 # ---------------------------------------------------------------------------
 
-RATE_LIMIT_DELAY = 0.3  # seconds between API calls
+_TITLE_TRANS = str.maketrans("_-", "  ")
 
 
 def pretty_title(filename_stem):
     """Convert a filename stem to a readable title."""
-    return filename_stem.replace("_", " ").replace("-", " ").title()
-
-
-def upload_directory(client, dir_path, parent_id, title_prefix, depth=0):
-    """Recursively upload a directory as nested Confluence pages."""
-    indent = "  " * depth
-    dir_name = Path(dir_path).name
-    print(f"\n{indent}📁 {dir_name}/")
-
-    entries = sorted(os.listdir(dir_path))
-    dirs = [e for e in entries if (Path(dir_path) / e).is_dir() and not e.startswith(".")]
-    files = [e for e in entries if e.endswith(".md") and (Path(dir_path) / e).is_file()]
-
-    # Upload markdown files as child pages
-    for f in files:
-        filepath = Path(dir_path) / f
-        readable = pretty_title(filepath.stem)
-        title = f"{title_prefix} - {readable}"
-
-        print(f"{indent}  📄 {f}")
-        with open(filepath, "r", encoding="utf-8") as fh:
-            body = md_to_storage(fh.read())
-        client.create_page(title, body, parent_id)
-        time.sleep(RATE_LIMIT_DELAY)
-
-    # Recurse into subdirectories
-    for d in dirs:
-        subdir = Path(dir_path) / d
-        sub_prefix = f"{title_prefix} / {d}"
-        body = f"<p>Index page for <strong>{d}</strong>.</p>"
-        folder_id = client.create_page(sub_prefix, body, parent_id)
-        if folder_id:
-            upload_directory(client, str(subdir), folder_id, sub_prefix, depth + 1)
-        time.sleep(RATE_LIMIT_DELAY)
+    return filename_stem.translate(_TITLE_TRANS).title()
+
+
+def upload_file(client, filepath, title, parent_id, body, indent=""):
+    """Upload one already-converted markdown file (thread-pool worker)."""
+    print(f"{indent}  📄 {Path(filepath).name}")
+    client.create_page(title, body, parent_id)
+
+
+def convert_and_upload(client, conversion, filepath, title, parent_id, indent=""):
+    """Thread-pool worker: wait for a file's conversion, then upload it.
+
+    Blocking on the conversion future is safe — conversions run on the
+    process pool and never depend on the thread pool. The payload semaphore
+    is released once the upload is done.
+    """
+    try:
+        body = conversion.result() if conversion is not None else _EMPTY_BODY
+        upload_file(client, filepath, title, parent_id, body, indent)
+    finally:
+        client.upload_sem.release()
+
+
+def submit_files(client, executor, convert_pool, file_jobs, indent=""):
+    """Feed `(filepath, title, parent_id, size)` jobs into the pipeline.
+
+    Each file's conversion (Pygments highlighting is pure-Python CPU work)
+    runs on the process pool while its upload waits on the thread pool, so
+    CPU and network overlap. Zero-byte files skip the converter and upload
+    the placeholder. Returns the upload futures without waiting on them;
+    client.upload_sem is held per file until its upload completes.
+    """
+    futures = []
+    for filepath, title, parent_id, size in file_jobs:
+        client.upload_sem.acquire()
+        conversion = None if size == 0 else convert_pool.submit(convert_file, str(filepath))
+        futures.append(
+            executor.submit(convert_and_upload, client, conversion, filepath, title, parent_id, indent)
+        )
+    return futures
+
+
+def upload_directory(client, executor, convert_pool, dir_path, parent_id, title_prefix, depth=0):
+    """Upload a directory tree as nested Confluence pages.
+
+    Iterative BFS over a work queue instead of recursion: as soon as a
+    directory's index page ID comes back, its subdirectories are enqueued and
+    its files enter the convert/upload pipeline, so independent subtrees
+    overlap freely instead of draining at each recursion boundary (and deep
+    trees cannot hit Python's recursion limit). Returns the upload futures;
+    the caller drains them.
+    """
+    uploads = []
+    queue = deque([(dir_path, parent_id, title_prefix, depth)])
+    while queue:
+        dir_path, parent_id, title_prefix, depth = queue.popleft()
+        indent = "  " * depth
+        print(f"\n{indent}📁 {Path(dir_path).name}/")
+
+        # One scandir pass: DirEntry caches is_dir/is_file from the directory
+        # read, so no per-entry stat() calls.
+        with os.scandir(dir_path) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        dirs = [e for e in entries if e.is_dir(follow_symlinks=False) and not e.name.startswith(".")]
+        files = [e for e in entries if e.is_file() and e.name.endswith(".md")]
+
+        # Upload markdown files as child pages (parallel, CPU + network overlap)
+        prefix = f"{title_prefix} - "
+        file_jobs = []
+        for f in files:
+            # files are pre-filtered to ".md", so the stem is just name[:-3]
+            file_jobs.append((f.path, prefix + pretty_title(f.name[:-3]), parent_id, f.stat().st_size))
+        uploads.extend(submit_files(client, executor, convert_pool, file_jobs, indent))
+
+        # Enqueue subdirectories once their index page exists
+        for d in dirs:
+            sub_prefix = f"{title_prefix} / {d.name}"
+            body = f"<p>Index page for <strong>{d.name}</strong>.</p>"
+            folder_id = client.create_page(sub_prefix, body, parent_id)
+            if folder_id:
+                queue.append((d.path, folder_id, sub_prefix, depth + 1))
+    return uploads
 
 
 # ---------------------------------------------------------------------------
@@ -220,10 +589,21 @@ def main():
     parser.add_argument("--root-title", help="Title for the root page (default: directory name)")
     parser.add_argument("--delete", metavar="TITLE", help="Delete a page tree by title instead of uploading")
     parser.add_argument("--dry-run", action="store_true", help="Preview without making changes")
+    parser.add_argument("--parallel", type=int, default=5, help="Initial concurrent upload workers; adapts to API latency (default: 5)")
+    parser.add_argument("--max-rate", type=int, default=10, help="Max API calls per second (default: 10)")
+    parser.add_argument("--upload-concurrency", type=int, default=10, help="Max file payloads held in memory at once (default: 10)")
 
     args = parser.parse_args()
     auth = get_auth()
-    client = ConfluenceClient(args.instance, args.space, auth, dry_run=args.dry_run)
+    client = ConfluenceClient(
+        args.instance,
+        args.space,
+        auth,
+        dry_run=args.dry_run,
+        max_rate=args.max_rate,
+        parallel=args.parallel,
+        upload_concurrency=args.upload_concurrency,
+    )
 
     print("=" * 60)
     if args.dry_run:
@@ -253,6 +633,10 @@ def main():
     print(f"Root page: {root_title}")
     print("=" * 60)
 
+    # One bulk lookup of everything already under the parent, so existence
+    # checks during the upload are cache hits instead of per-page GETs.
+    client.prefetch_titles(args.parent_id)
+
     # Create root page
     root_body = f"<p>Root page for <strong>{root_title}</strong>.</p>"
     root_id = client.create_page(root_title, root_body, args.parent_id)
@@ -260,35 +644,36 @@ def main():
         print("ERROR: Could not create root page. Aborting.")
         sys.exit(1)
 
-    # Process top-level subdirectories
-    top_dirs = sorted([
-        d for d in os.listdir(dir_path)
-        if os.path.isdir(os.path.join(dir_path, d)) and not d.startswith(".")
-    ])
-    top_files = sorted([
-        f for f in os.listdir(dir_path)
-        if f.endswith(".md") and os.path.isfile(os.path.join(dir_path, f))
-    ])
-
-    # Upload any top-level .md files
-    for f in top_files:
-        filepath = os.path.join(dir_path, f)
-        readable = pretty_title(Path(f).stem)
-        title = f"{root_title} - {readable}"
-        print(f"📄 {f}")
-        with open(filepath, "r", encoding="utf-8") as fh:
-            body = md_to_storage(fh.read())
-        client.create_page(title, body, root_id)
-        time.sleep(RATE_LIMIT_DELAY)
-
-    # Process subdirectories
-    for d in top_dirs:
-        sub_path = os.path.join(dir_path, d)
-        folder_title = d
-        folder_body = f"<p>Artefacts for <strong>{d}</strong>.</p>"
-        folder_id = client.create_page(folder_title, folder_body, root_id)
-        if folder_id:
-            upload_directory(client, sub_path, folder_id, d, depth=1)
+    # Classify top-level entries in one scandir pass (no per-entry stat calls)
+    with os.scandir(dir_path) as it:
+        all_entries = sorted(it, key=lambda e: e.name)
+    top_dirs = [e for e in all_entries if e.is_dir(follow_symlinks=False) and not e.name.startswith(".")]
+    top_files = [e for e in all_entries if e.is_file() and e.name.endswith(".md")]
+
+    # Thread count matches the AIMD ceiling; the controller's semaphore
+    # decides how many of those threads may have a request in flight. The
+    # process pool keeps markdown/Pygments conversion off the network path.
+    with ThreadPoolExecutor(max_workers=client.controller.maximum) as executor, \
+            ProcessPoolExecutor(max_workers=os.cpu_count()) as convert_pool:
+        # Upload any top-level .md files
+        prefix = f"{root_title} - "
+        file_jobs = []
+        for f in top_files:
+            file_jobs.append((f.path, prefix + pretty_title(f.name[:-3]), root_id, f.stat().st_size))
+        uploads = submit_files(client, executor, convert_pool, file_jobs)
+
+        # Process subdirectories
+        for d in top_dirs:
+            folder_body = f"<p>Artefacts for <strong>{d.name}</strong>.</p>"
+            folder_id = client.create_page(d.name, folder_body, root_id)
+            if folder_id:
+                uploads.extend(
+                    upload_directory(client, executor, convert_pool, d.path, folder_id, d.name, depth=1)
+                )
+
+        # Drain every file upload across the whole tree
+        for fut in as_completed(uploads):
+            fut.result()
 
     client.print_stats()
 